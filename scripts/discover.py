@@ -22,7 +22,6 @@ from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from core.chains import CHAIN_NAMES, DEFAULT_CHAIN, get_chain
-from core.discovery import discover_robots
 
 
 def _load_bearer_token() -> str:
@@ -169,6 +168,9 @@ parser.add_argument("--token", default="",
                     help="MCP bearer token to use for auth headers (overrides MCP_BEARER_TOKEN in .env)")
 args = parser.parse_args()
 
+# Deferred so --help doesn't pay for agent0_sdk/web3/fastmcp imports
+from core.discovery import discover_robots
+
 _chain_cfg = get_chain(args.chain)
 print(f"Querying ERC-8004 registry on {_chain_cfg['name']} (chain {_chain_cfg['chain_id']})...\n")
 
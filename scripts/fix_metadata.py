@@ -22,9 +22,7 @@ import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from robots import discover_plugins
 from core.chains import CHAIN_NAMES, DEFAULT_CHAIN
-from core.registration import fix_metadata
 
 parser = argparse.ArgumentParser(description="Fix on-chain metadata for a robot agent")
 parser.add_argument("robot", help="Robot plugin name (e.g. tumbller, tello, fakerover)")
@@ -40,10 +38,15 @@ parser.add_argument(
 )
 args = parser.parse_args()
 
+# Deferred so --help doesn't pay for agent0_sdk/web3/fastmcp imports
+from robots import discover_plugins
+from core.registration import fix_metadata
+
 plugins = discover_plugins()
 if args.robot not in plugins:
     print(f"Unknown robot: '{args.robot}'. Available: {list(plugins.keys())}")
     sys.exit(1)
 
-plugin = plugins[args.robot]()
+plugin_cls = plugins[args.robot]()  # imports only the selected plugin
+plugin = plugin_cls()
 fix_metadata(plugin, args.agent_id, chain=args.chain)
@@ -12,12 +12,13 @@ import os
 # Ensure src/ is on the path when run from repo root
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from core.wallet import get_existing_wallet, generate_and_save
-
 parser = argparse.ArgumentParser(description="Manage the Ethereum wallet for ERC-8004 registration")
 parser.add_argument("--new", action="store_true", help="Generate a new wallet and save to .env")
 args = parser.parse_args()
 
+# Deferred so --help doesn't pay for the web3 import
+from core.wallet import get_existing_wallet, generate_and_save
+
 if args.new:
     generate_and_save()
 else:
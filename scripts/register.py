@@ -17,9 +17,7 @@ import os
 # Ensure src/ is on the path when run from repo root
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from robots import discover_plugins
 from core.chains import CHAIN_NAMES, DEFAULT_CHAIN
-from core.registration import register_robot
 
 parser = argparse.ArgumentParser(description="Register a robot plugin on ERC-8004")
 parser.add_argument("robot", help="Robot plugin name (e.g. tumbller, tello, fakerover)")
@@ -34,10 +32,15 @@ parser.add_argument(
 )
 args = parser.parse_args()
 
+# Deferred so --help doesn't pay for agent0_sdk/web3/fastmcp imports
+from robots import discover_plugins
+from core.registration import register_robot
+
 plugins = discover_plugins()
 if args.robot not in plugins:
     print(f"Unknown robot: '{args.robot}'. Available: {list(plugins.keys())}")
     sys.exit(1)
 
-plugin = plugins[args.robot]()
+plugin_cls = plugins[args.robot]()  # imports only the selected plugin
+plugin = plugin_cls()
 register_robot(plugin, chain=args.chain)
@@ -27,18 +27,16 @@ import os
 # Ensure src/ is on the path when run from repo root
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-import uvicorn
-
-from robots import discover_plugins
-from core.server import create_gateway
-
 parser = argparse.ArgumentParser(description="Start the robot fleet MCP gateway")
 parser.add_argument("--robots", nargs="*", help="Robot plugins to load (default: all)")
 parser.add_argument("--port", type=int, default=8000)
 parser.add_argument("--ngrok", action="store_true", help="Open an ngrok tunnel to the gateway")
 args = parser.parse_args()
 
-# Discover and filter plugins
+# Heavy imports are deferred until after argument parsing so --help stays fast
+from robots import discover_plugins
+
+# Discover plugin names (no imports yet) and filter
 all_plugins = discover_plugins()
 if args.robots:
     unknown = set(args.robots) - set(all_plugins.keys())
@@ -53,7 +51,8 @@ if not selected:
     print("No robot plugins found. Check src/robots/ for plugin packages.")
     sys.exit(1)
 
-plugins = {name: cls() for name, cls in selected.items()}
+# Only the selected plugin packages are imported here
+plugins = {name: load()() for name, load in selected.items()}
 
 print(f"Loading {len(plugins)} robot(s): {', '.join(plugins.keys())}")
 for name, plugin in plugins.items():
@@ -61,6 +60,10 @@ for name, plugin in plugins.items():
     print(f"  /{name}/mcp — {meta.name} ({len(plugin.tool_names())} tools)")
 print(f"  /fleet/mcp  — Fleet orchestrator (discovery)")
 
+import uvicorn
+
+from core.server import create_gateway
+
 app = create_gateway(plugins)
 
 if args.ngrok:
@@ -0,0 +1,57 @@
+"""On-disk cache for on-chain metadata reads and IPFS agent cards.
+
+Shared by discovery (reads) and registration (invalidation after writes).
+On-chain metadata is mutable, so entries expire after ``METADATA_TTL``
+seconds. IPFS documents are content-addressed and cached indefinitely by
+CID.
+"""
+
+import functools
+import os
+
+from diskcache import Cache
+
+CACHE_DIR = os.path.expanduser("~/.cache/yakrover/meta")
+
+METADATA_TTL = 60  # seconds
+
+# Pseudo metadata key under which an agent's tokenURI is cached.
+TOKEN_URI_KEY = "tokenURI"
+
+
+@functools.cache
+def _cache() -> Cache:
+    """Open the process-wide cache (created on first use)."""
+    return Cache(CACHE_DIR)
+
+
+def _metadata_key(chain_id: int, agent_id: int, key: str) -> tuple:
+    # Agent IDs are only unique per chain, so the chain is part of the key.
+    return ("meta", chain_id, agent_id, key)
+
+
+def get_metadata(chain_id: int, agent_id: int, key: str):
+    """Return a cached metadata value, or ``None`` if absent or expired."""
+    return _cache().get(_metadata_key(chain_id, agent_id, key))
+
+
+def set_metadata(chain_id: int, agent_id: int, key: str, value) -> None:
+    """Cache a metadata value for ``METADATA_TTL`` seconds."""
+    _cache().set(_metadata_key(chain_id, agent_id, key), value, expire=METADATA_TTL)
+
+
+def invalidate_metadata(chain_id: int, agent_id: int, keys) -> None:
+    """Drop cached metadata entries after an on-chain write."""
+    cache = _cache()
+    for key in keys:
+        cache.delete(_metadata_key(chain_id, agent_id, key))
+
+
+def get_ipfs(cid: str) -> dict | None:
+    """Return a cached IPFS document by CID, or ``None``."""
+    return _cache().get(("ipfs", cid))
+
+
+def set_ipfs(cid: str, data: dict) -> None:
+    """Cache an IPFS document by CID (no expiry — CIDs are immutable)."""
+    _cache().set(("ipfs", cid), data)
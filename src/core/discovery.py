@@ -6,24 +6,143 @@ function (``discover_robots``) and an MCP tool registrar
 (``register_discovery_tools``) so LLMs can discover robots at runtime.
 """
 
+import asyncio
+import functools
+import logging
 import os
+import re
+import time
+from contextlib import asynccontextmanager, suppress
 
+import aiohttp
+import orjson
 import requests
 from agent0_sdk import SDK
 from dotenv import load_dotenv
+from eth_utils import function_signature_to_4byte_selector
 from fastmcp import FastMCP
 
+from core import cache
 from core.chains import CHAIN_NAMES, get_chain
 
 load_dotenv()
 
-IPFS_GATEWAY = "https://ipfs.io/ipfs/"
+logger = logging.getLogger(__name__)
+
+# Public gateways raced for every CID; the first successful response wins.
+IPFS_GATEWAYS = (
+    "https://ipfs.io/ipfs/",
+    "https://dweb.link/ipfs/",
+    "https://gateway.pinata.cloud/ipfs/",
+)
+
+_IPFS_TIMEOUT = aiohttp.ClientTimeout(total=10, sock_connect=2, sock_read=5)
+
+# Agent cards are a few KB; anything past one IPFS chunk (256 KiB) is rejected.
+_MAX_CARD_BYTES = 256 * 1024
+
+# Multicall3 is deployed at the same address on every supported chain.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+_MULTICALL3_ABI = [
+    {
+        "name": "aggregate3",
+        "type": "function",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            }
+        ],
+    }
+]
+
+# Max sub-calls per aggregate3 eth_call — keeps each request well under
+# public RPC gas / payload caps.
+_MULTICALL_BATCH = 500
+
+# Agents read concurrently when falling back to per-call reads.
+_DIRECT_CONCURRENCY = 8
+
+# On-chain metadata keys read for every candidate agent.
+_ROBOT_KEYS = ("category", "robot_type", "fleet_provider", "fleet_domain")
+
+# Pseudo-key under which the agent's tokenURI is returned alongside metadata.
+_TOKEN_URI = cache.TOKEN_URI_KEY
+
+# Subgraph results more than this many blocks behind the chain head are
+# treated as stale and discovery falls back to on-chain reads.
+_SUBGRAPH_MAX_LAG = 100
+
+_SUBGRAPH_QUERY = """
+query Robots($where: Agent_filter!, $first: Int!) {
+  _meta { block { number } }
+  agents(where: $where, first: $first) {
+    agentId
+    agentURI
+    registrationFile { name mcpTools }
+    metadata { key value }
+  }
+}
+"""
+
+# Function selectors, computed once instead of per-call by web3's ABI layer.
+_GET_METADATA_SELECTOR = function_signature_to_4byte_selector("getMetadata(uint256,string)")
+_TOKEN_URI_SELECTOR = function_signature_to_4byte_selector("tokenURI(uint256)")
+
+
+def _encode_key_tail(key: str) -> bytes:
+    """ABI-encode the dynamic ``string key`` argument of ``getMetadata``.
+
+    Layout: head offset (0x40, after the two head words), byte length, then
+    the UTF-8 bytes right-padded to a 32-byte boundary.
+    """
+    data = key.encode()
+    return (
+        (64).to_bytes(32, "big")
+        + len(data).to_bytes(32, "big")
+        + data
+        + b"\0" * (-len(data) % 32)
+    )
+
+
+_KEY_TAILS = {key: _encode_key_tail(key) for key in _ROBOT_KEYS}
+
+
+def _get_metadata_calldata(agent_id: int, key: str) -> bytes:
+    """Calldata for ``getMetadata(agent_id, key)``."""
+    tail = _KEY_TAILS.get(key) or _encode_key_tail(key)
+    return _GET_METADATA_SELECTOR + agent_id.to_bytes(32, "big") + tail
+
 
+def _token_uri_calldata(agent_id: int) -> bytes:
+    """Calldata for ``tokenURI(agent_id)``."""
+    return _TOKEN_URI_SELECTOR + agent_id.to_bytes(32, "big")
 
+
+@functools.lru_cache(maxsize=None)
 def _get_sdk(chain: str | None = None) -> SDK:
-    """Create a read-only SDK instance for on-chain queries.
+    """Return the read-only SDK instance for on-chain queries.
 
-    No signer needed — discovery is read-only.
+    No signer needed — discovery is read-only. Memoized per chain so
+    repeated discovery calls reuse the same web3 provider and its
+    keep-alive HTTP session.
 
     Args:
         chain: Chain name (e.g. ``"base-mainnet"``). Defaults to the
@@ -62,48 +181,422 @@ def _parse_bidding_terms(metadata: dict) -> dict | None:
     }
 
 
-def _fetch_ipfs_mcp_meta(sdk: SDK, agent_id_int: int) -> dict:
-    """Fetch MCP service metadata from IPFS (bypasses subgraph lag).
+def _multicall_metadata(
+    sdk: SDK, agent_ids: list[int], keys: tuple[str, ...]
+) -> dict[tuple[int, str], bytes | str]:
+    """Read metadata keys and tokenURI for many agents via Multicall3.
+
+    Builds one ``getMetadata(agent_id, key)`` sub-call per agent/key pair
+    plus one ``tokenURI(agent_id)`` per agent, and sends them through
+    ``aggregate3`` so a whole discovery pass costs one eth_call per
+    ``_MULTICALL_BATCH`` sub-calls instead of one per read.
+
+    Returns:
+        Dict keyed by ``(agent_id, key)`` — metadata values are ``bytes``,
+        the ``_TOKEN_URI`` entry is a ``str``. Sub-calls that revert are
+        omitted.
+    """
+    registry = sdk.identity_registry
+    w3 = registry.w3
+    multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=_MULTICALL3_ABI)
+
+    # (result key, calldata, ABI output type) per sub-call
+    specs: list[tuple[tuple[int, str], bytes, str]] = []
+    for aid in agent_ids:
+        for key in keys:
+            specs.append(((aid, key), _get_metadata_calldata(aid, key), "bytes"))
+        specs.append(((aid, _TOKEN_URI), _token_uri_calldata(aid), "string"))
+
+    values: dict[tuple[int, str], bytes | str] = {}
+    for start in range(0, len(specs), _MULTICALL_BATCH):
+        chunk = specs[start:start + _MULTICALL_BATCH]
+        results = multicall.functions.aggregate3(
+            [(registry.address, True, calldata) for _, calldata, _ in chunk]
+        ).call()
+        for (result_key, _, out_type), (success, data) in zip(chunk, results):
+            if success and data:
+                values[result_key] = w3.codec.decode([out_type], data)[0]
+    return values
+
+
+def _read_agent_direct(sdk: SDK, agent_id: int, keys: tuple[str, ...]) -> dict:
+    """Read one agent's metadata keys and tokenURI with individual eth_calls."""
+    registry = sdk.identity_registry
+    w3 = registry.w3
+
+    def _call(calldata: bytes, out_type: str):
+        data = w3.eth.call({"to": registry.address, "data": calldata})
+        return w3.codec.decode([out_type], data)[0]
+
+    values: dict[tuple[int, str], bytes | str] = {
+        (agent_id, key): _call(_get_metadata_calldata(agent_id, key), "bytes") for key in keys
+    }
+    try:
+        values[(agent_id, _TOKEN_URI)] = _call(_token_uri_calldata(agent_id), "string")
+    except Exception:
+        pass
+    return values
+
+
+async def _gather_direct(
+    sdk: SDK, agent_ids: list[int], keys: tuple[str, ...]
+) -> dict[tuple[int, str], bytes | str]:
+    """Run ``_read_agent_direct`` for every agent on worker threads.
+
+    At most ``_DIRECT_CONCURRENCY`` agents are in flight at once, so their
+    RPC round-trips overlap without flooding a public endpoint.
+    """
+    sem = asyncio.Semaphore(_DIRECT_CONCURRENCY)
+
+    async def _process_agent(agent_id: int) -> dict:
+        async with sem:
+            return await asyncio.to_thread(_read_agent_direct, sdk, agent_id, keys)
+
+    values: dict[tuple[int, str], bytes | str] = {}
+    for result in await asyncio.gather(*(_process_agent(aid) for aid in agent_ids)):
+        values.update(result)
+    return values
+
+
+def _direct_metadata(
+    sdk: SDK, agent_ids: list[int], keys: tuple[str, ...]
+) -> dict[tuple[int, str], bytes | str]:
+    """Per-call fallback for ``_multicall_metadata`` (same return shape)."""
+    return asyncio.run(_gather_direct(sdk, agent_ids, keys))
+
+
+def _read_agent_metadata(
+    sdk: SDK, chain_id: int, agent_ids: list[int], keys: tuple[str, ...]
+) -> dict[tuple[int, str], bytes | str]:
+    """Batch-read metadata, serving fresh values from the on-disk cache.
+
+    Only agents with at least one uncached key hit the chain. Falls back to
+    per-call reads when Multicall3 isn't available.
+    """
+    all_keys = (*keys, _TOKEN_URI)
+    values: dict[tuple[int, str], bytes | str] = {}
+    missing = []
+    for aid in agent_ids:
+        cached = {k: cache.get_metadata(chain_id, aid, k) for k in all_keys}
+        if any(v is None for v in cached.values()):
+            missing.append(aid)
+            continue
+        values.update({(aid, k): v for k, v in cached.items()})
+
+    if not missing:
+        return values
+    try:
+        fetched = _multicall_metadata(sdk, missing, keys)
+    except Exception:
+        # No Multicall3 on this chain (empty code → undecodable result)
+        fetched = _direct_metadata(sdk, missing, keys)
+
+    for aid in missing:
+        for k in all_keys:
+            # Cache empty values too, so unset keys don't force a re-read
+            value = fetched.get((aid, k), "" if k == _TOKEN_URI else b"")
+            cache.set_metadata(chain_id, aid, k, value)
+            values[(aid, k)] = value
+    return values
+
+
+def _parse_mcp_meta(data: dict) -> dict:
+    """Extract MCP service fields and bidding terms from an IPFS agent card.
 
     Returns a dict with ``mcpTools``, ``fleetEndpoint``, and optionally
     ``biddingTerms`` keys (any may be absent if not stored).
     """
+    result: dict = {}
+    for svc in data.get("services", []):
+        if svc.get("name") == "MCP":
+            result["mcpEndpoint"] = svc.get("endpoint")
+            result["mcpTools"] = svc.get("mcpTools", [])
+            result["fleetEndpoint"] = svc.get("fleetEndpoint")
+            break
+    bidding_terms = _parse_bidding_terms(data.get("metadata", {}))
+    if bidding_terms is not None:
+        result["biddingTerms"] = bidding_terms
+    return result
+
+
+async def _fetch_gateway(session: aiohttp.ClientSession, url: str) -> dict:
+    """GET one gateway URL and parse the response body as JSON.
+
+    Reads at most ``_MAX_CARD_BYTES``; larger bodies are rejected rather
+    than buffered.
+    """
+    async with session.get(url) as resp:
+        if resp.status != 200:
+            raise ValueError(f"{url} returned HTTP {resp.status}")
+        # Content-type is ignored: gateways don't always label the card as JSON
+        body = await resp.content.read(_MAX_CARD_BYTES + 1)
+        if len(body) > _MAX_CARD_BYTES:
+            raise ValueError(f"{url} agent card exceeds {_MAX_CARD_BYTES} bytes")
+        return orjson.loads(body)
+
+
+async def _fetch_agent_card(session: aiohttp.ClientSession, uri: str) -> dict | None:
+    """Fetch the raw IPFS agent card JSON for a ``tokenURI``.
+
+    Requests the CID from every gateway in ``IPFS_GATEWAYS`` at once and
+    uses whichever answers successfully first; the slower requests are
+    cancelled. Documents are cached on disk by CID.
+
+    Args:
+        session: Shared aiohttp session.
+        uri: The agent's on-chain ``tokenURI`` (``ipfs://<cid>``).
+
+    Returns:
+        The card as a dict, or ``None`` if the URI isn't on IPFS or no
+        gateway returned a JSON object.
+    """
+    if not uri or not uri.startswith("ipfs://"):
+        return None
+    cid = uri.replace("ipfs://", "")
+    data = cache.get_ipfs(cid)
+    if data is not None:
+        return data
+    pending = {
+        asyncio.ensure_future(_fetch_gateway(session, f"{gateway}{cid}"))
+        for gateway in IPFS_GATEWAYS
+    }
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None:
+                    continue
+                data = task.result()
+                if not isinstance(data, dict):
+                    continue
+                cache.set_ipfs(cid, data)
+                return data
+    finally:
+        for task in pending:
+            task.cancel()
+    return None
+
+
+async def _fetch_ipfs_mcp_meta(session: aiohttp.ClientSession, uri: str) -> dict:
+    """Fetch MCP service metadata from IPFS (bypasses subgraph lag)."""
+    data = await _fetch_agent_card(session, uri)
+    if data is None:
+        return {}
+    try:
+        return _parse_mcp_meta(data)
+    except Exception:
+        return {}
+
+
+def fetch_agent_card(uri: str) -> dict | None:
+    """Blocking wrapper around ``_fetch_agent_card`` for one URI."""
+
+    async def _run() -> dict | None:
+        async with aiohttp.ClientSession(timeout=_IPFS_TIMEOUT) as session:
+            return await _fetch_agent_card(session, uri)
+
+    return asyncio.run(_run())
+
+
+async def _gather_ipfs(uris: list[str]) -> list[dict]:
+    """Fetch the IPFS agent card for every URI concurrently, preserving order."""
+    connector = aiohttp.TCPConnector(limit=32)
+    async with aiohttp.ClientSession(connector=connector, timeout=_IPFS_TIMEOUT) as session:
+        return await asyncio.gather(*(_fetch_ipfs_mcp_meta(session, uri) for uri in uris))
+
+
+def _robot_entry(agent_id: str, name: str, tools: list, rtype: bytes, provider: bytes, fleet: bytes) -> dict:
+    """Build a discovery result; IPFS-sourced fields are filled in later."""
+    return {
+        "agent_id": agent_id,
+        "name": name,
+        "robot_type": rtype.decode(),
+        "fleet_provider": provider.decode(),
+        "fleet_domain": fleet.decode(),
+        "mcp_endpoint": None,
+        "mcp_tools": tools,
+        "fleet_endpoint": None,
+    }
+
+
+def _subgraph_url(sdk: SDK, chain: str | None) -> str | None:
+    """Return the ERC-8004 subgraph URL for the active chain, if known.
+
+    ``SUBGRAPH_URL`` in ``.env`` overrides it only when no explicit chain is
+    given (same rule as ``RPC_URL``); otherwise the SDK's own subgraph
+    endpoint is used.
+    """
+    override = os.getenv("SUBGRAPH_URL") if chain is None else None
+    if override:
+        return override
+    client = getattr(sdk, "subgraph_client", None)
+    return getattr(client, "subgraph_url", None) or getattr(client, "url", None)
+
+
+def _search_robots_subgraph(
+    sdk: SDK,
+    chain: str | None,
+    chain_id: int,
+    robot_type: str | None,
+    fleet_provider: str | None,
+    limit: int | None = None,
+) -> list[tuple[dict, str]] | None:
+    """Find robot agents with one GraphQL query against the subgraph.
+
+    The ``category``/``robot_type``/``fleet_provider`` filters are applied
+    server-side and metadata comes back inline, replacing the per-agent
+    eth_calls of ``_search_robots_onchain``.
+
+    Returns:
+        ``(entry, tokenURI)`` pairs, or ``None`` when the subgraph is
+        unavailable, more than ``_SUBGRAPH_MAX_LAG`` blocks behind the chain,
+        or has no matches — callers then fall back to the on-chain path.
+    """
+    url = _subgraph_url(sdk, chain)
+    if not url:
+        return None
+
+    wanted = {"category": "robot"}
+    # "unknown" means the key is unset, which the subgraph filter can't express
+    if robot_type and robot_type != "unknown":
+        wanted["robot_type"] = robot_type
+    if fleet_provider:
+        wanted["fleet_provider"] = fleet_provider
+    where = {
+        "and": [
+            {"metadata_": {"key": key, "value": "0x" + value.encode().hex()}}
+            for key, value in wanted.items()
+        ]
+    }
+
     try:
-        uri = sdk.identity_registry.functions.tokenURI(agent_id_int).call()
-        if not uri or not uri.startswith("ipfs://"):
-            return {}
-        cid = uri.replace("ipfs://", "")
-        resp = requests.get(f"{IPFS_GATEWAY}{cid}", timeout=10)
+        resp = requests.post(
+            url,
+            json={"query": _SUBGRAPH_QUERY, "variables": {"where": where, "first": limit or 1000}},
+            timeout=10,
+        )
         resp.raise_for_status()
-        data = resp.json()
-        result: dict = {}
-        for svc in data.get("services", []):
-            if svc.get("name") == "MCP":
-                result["mcpEndpoint"] = svc.get("endpoint")
-                result["mcpTools"] = svc.get("mcpTools", [])
-                result["fleetEndpoint"] = svc.get("fleetEndpoint")
-                break
-        bidding_terms = _parse_bidding_terms(data.get("metadata", {}))
-        if bidding_terms is not None:
-            result["biddingTerms"] = bidding_terms
-        return result
+        data = resp.json()["data"]
+        indexed_block = data["_meta"]["block"]["number"]
+        if sdk.identity_registry.w3.eth.block_number - indexed_block > _SUBGRAPH_MAX_LAG:
+            return None
+        agents = data["agents"]
     except Exception:
-        pass
-    return {}
+        return None
+    if not agents:
+        return None
+
+    rt_b = robot_type.encode() if robot_type else None
+    fp_b = fleet_provider.encode() if fleet_provider else None
+
+    matches = []
+    for agent in agents:
+        meta = {m["key"]: bytes.fromhex(m["value"].removeprefix("0x")) for m in agent.get("metadata", [])}
+        rtype = meta.get("robot_type") or b"unknown"
+        provider = meta.get("fleet_provider", b"")
+        if rt_b is not None and rtype != rt_b:
+            continue
+        if fp_b is not None and provider != fp_b:
+            continue
+        reg = agent.get("registrationFile") or {}
+        entry = _robot_entry(
+            f"{chain_id}:{agent['agentId']}",
+            reg.get("name"),
+            reg.get("mcpTools") or [],
+            rtype,
+            provider,
+            meta.get("fleet_domain", b""),
+        )
+        matches.append((entry, agent.get("agentURI") or ""))
+        if limit is not None and len(matches) >= limit:
+            break
+    return matches
+
+
+def _search_robots_onchain(
+    sdk: SDK,
+    chain_id: int,
+    robot_type: str | None,
+    fleet_provider: str | None,
+    limit: int | None = None,
+) -> list[tuple[dict, str]]:
+    """Find robot agents via ``searchAgents`` plus batched on-chain metadata reads.
+
+    With ``limit``, agents are read ``limit`` at a time and reading stops
+    once enough matches are found.
+
+    Returns ``(entry, tokenURI)`` pairs for the matching robots.
+    """
+    results = sdk.searchAgents(hasMetadataKey="category")
+
+    agents = []
+    for agent in results:
+        agent_id_str = agent.get("agentId") if isinstance(agent, dict) else agent.agentId
+        agent_id_int = int(str(agent_id_str).split(":")[-1])
+        agents.append((agent, agent_id_str, agent_id_int))
+
+    rt_b = robot_type.encode() if robot_type else None
+    fp_b = fleet_provider.encode() if fleet_provider else None
+
+    matches = []
+    window = limit or len(agents) or 1
+    for start in range(0, len(agents), window):
+        batch = agents[start:start + window]
+        # One batched read for every key of every agent, then filter locally
+        onchain = _read_agent_metadata(sdk, chain_id, [aid for _, _, aid in batch], _ROBOT_KEYS)
+
+        for agent, agent_id_str, agent_id_int in batch:
+            # Only include agents with category=robot
+            if onchain.get((agent_id_int, "category")) != b"robot":
+                continue
+
+            rtype = onchain.get((agent_id_int, "robot_type"), b"") or b"unknown"
+            provider = onchain.get((agent_id_int, "fleet_provider"), b"")
+
+            # Filter on the raw bytes; only survivors get decoded
+            if rt_b is not None and rtype != rt_b:
+                continue
+            if fp_b is not None and provider != fp_b:
+                continue
+
+            name = agent.get("name") if isinstance(agent, dict) else agent.name
+            tools = agent.get("mcpTools", []) if isinstance(agent, dict) else getattr(agent, "mcpTools", [])
+
+            entry = _robot_entry(
+                agent_id_str,
+                name,
+                tools,
+                rtype,
+                provider,
+                onchain.get((agent_id_int, "fleet_domain"), b""),
+            )
+            matches.append((entry, onchain.get((agent_id_int, _TOKEN_URI), "")))
+            if limit is not None and len(matches) >= limit:
+                return matches
+    return matches
 
 
 def discover_robots(
     robot_type: str | None = None,
     fleet_provider: str | None = None,
     chain: str | None = None,
+    limit: int | None = None,
 ) -> list[dict]:
     """Query the on-chain registry for robot agents.
 
+    Tries a single filtered subgraph query first and falls back to
+    ``searchAgents`` plus on-chain metadata reads when the subgraph is
+    unavailable, stale, or returns nothing.
+
+    Blocking — runs its own event loop for the IPFS fetches, so async
+    callers should run it in a worker thread.
+
     Args:
         robot_type: Filter by robot type (e.g. "differential_drive", "quadrotor").
         fleet_provider: Filter by fleet operator (e.g. "yakrover").
         chain: Chain name (e.g. ``"base-mainnet"``). Defaults to the
                ``CHAIN`` env var or ``eth-sepolia``.
+        limit: Stop after this many matches (``None`` = return all).
 
     Returns:
         List of dicts, one per matching robot, with keys: ``agent_id``,
@@ -111,56 +604,121 @@ def discover_robots(
         ``mcp_endpoint``, ``mcp_tools``, and ``fleet_endpoint``.
     """
     sdk = _get_sdk(chain)
-    results = sdk.searchAgents(hasMetadataKey="category")
-    robots = []
+    chain_id = get_chain(chain)["chain_id"]
 
-    for agent in results:
-        agent_id_str = agent.get("agentId") if isinstance(agent, dict) else agent.agentId
-        agent_id_int = int(str(agent_id_str).split(":")[-1])
+    matches = _search_robots_subgraph(sdk, chain, chain_id, robot_type, fleet_provider, limit)
+    if matches is None:
+        matches = _search_robots_onchain(sdk, chain_id, robot_type, fleet_provider, limit)
 
-        # Only include agents with category=robot
-        meta_category = sdk.identity_registry.functions.getMetadata(agent_id_int, "category").call()
-        if meta_category != b"robot":
-            continue
-
-        rtype = sdk.identity_registry.functions.getMetadata(agent_id_int, "robot_type").call()
-        provider = sdk.identity_registry.functions.getMetadata(agent_id_int, "fleet_provider").call()
-        fleet = sdk.identity_registry.functions.getMetadata(agent_id_int, "fleet_domain").call()
+    robots = [entry for entry, _ in matches]
+    uris = [uri for _, uri in matches]
 
-        rtype_str = rtype.decode() if rtype else "unknown"
-        provider_str = provider.decode() if provider else ""
-        fleet_str = fleet.decode() if fleet else ""
+    # Fetch all agent cards in one concurrent window instead of serially
+    ipfs_metas = asyncio.run(_gather_ipfs(uris)) if uris else []
 
-        if robot_type and rtype_str != robot_type:
-            continue
-        if fleet_provider and provider_str != fleet_provider:
-            continue
-
-        name = agent.get("name") if isinstance(agent, dict) else agent.name
-        tools = agent.get("mcpTools", []) if isinstance(agent, dict) else getattr(agent, "mcpTools", [])
-
-        ipfs_meta = _fetch_ipfs_mcp_meta(sdk, agent_id_int)
-        if not tools:
-            tools = ipfs_meta.get("mcpTools", [])
-        fleet_endpoint = ipfs_meta.get("fleetEndpoint")
-
-        entry: dict = {
-            "agent_id": agent_id_str,
-            "name": name,
-            "robot_type": rtype_str,
-            "fleet_provider": provider_str,
-            "fleet_domain": fleet_str,
-            "mcp_endpoint": ipfs_meta.get("mcpEndpoint"),
-            "mcp_tools": tools,
-            "fleet_endpoint": fleet_endpoint,
-        }
+    for entry, ipfs_meta in zip(robots, ipfs_metas):
+        entry["mcp_endpoint"] = ipfs_meta.get("mcpEndpoint")
+        if not entry["mcp_tools"]:
+            entry["mcp_tools"] = ipfs_meta.get("mcpTools", [])
+        entry["fleet_endpoint"] = ipfs_meta.get("fleetEndpoint")
         if "biddingTerms" in ipfs_meta:
             entry["bidding_terms"] = ipfs_meta["biddingTerms"]
-        robots.append(entry)
 
     return robots
 
 
+# How long the MCP tool serves a discovery result before re-querying.
+DISCOVERY_TTL = 30.0  # seconds
+
+
+class _DiscoveryCache:
+    """TTL cache in front of ``discover_robots`` for the MCP tool.
+
+    Results are keyed by the query arguments. Concurrent misses for the same
+    query wait on one lock, so only the first caller hits the chain and the
+    rest reuse its result.
+    """
+
+    def __init__(self, ttl: float = DISCOVERY_TTL):
+        self.ttl = ttl
+        self._entries: dict[tuple, tuple[float, list[dict]]] = {}
+        self._locks: dict[tuple, asyncio.Lock] = {}
+
+    def _fresh(self, key: tuple) -> list[dict] | None:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    async def _refresh(self, key: tuple) -> list[dict]:
+        robot_type, fleet_provider, chain, limit = key
+        robots = await asyncio.to_thread(
+            discover_robots,
+            robot_type=robot_type,
+            fleet_provider=fleet_provider,
+            chain=chain,
+            limit=limit,
+        )
+        self._entries[key] = (time.monotonic(), robots)
+        return robots
+
+    async def get(
+        self,
+        robot_type: str | None = None,
+        fleet_provider: str | None = None,
+        chain: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Return discovery results, re-querying only when stale."""
+        key = (robot_type, fleet_provider, chain, limit)
+        robots = self._fresh(key)
+        if robots is not None:
+            return robots
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            # Another caller may have refreshed while we waited
+            robots = self._fresh(key)
+            if robots is not None:
+                return robots
+            return await self._refresh(key)
+
+    async def prewarm_forever(self) -> None:
+        """Keep the unfiltered default-chain query fresh until cancelled."""
+        key = (None, None, None, None)
+        while True:
+            try:
+                async with self._locks.setdefault(key, asyncio.Lock()):
+                    await self._refresh(key)
+            except Exception:
+                logger.warning("Background robot discovery refresh failed", exc_info=True)
+            await asyncio.sleep(self.ttl)
+
+
+_discovery_cache = _DiscoveryCache()
+_prewarm_task: asyncio.Task | None = None
+
+
+@asynccontextmanager
+async def discovery_lifespan(server: FastMCP):
+    """FastMCP lifespan that pre-warms the discovery cache in the background.
+
+    Pass as ``lifespan=`` to the server that ``register_discovery_tools`` is
+    called on, so the common unfiltered query is usually a cache hit.
+    """
+    global _prewarm_task
+    if _prewarm_task is not None and not _prewarm_task.done():
+        # Already warming (lifespan entered again, e.g. per session)
+        yield {}
+        return
+    _prewarm_task = task = asyncio.create_task(_discovery_cache.prewarm_forever())
+    try:
+        yield {}
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        _prewarm_task = None
+
+
 def register_discovery_tools(
     mcp: FastMCP,
     mounted_robots: dict[str, str] | None = None,
@@ -174,12 +732,17 @@ def register_discovery_tools(
                         Used to enrich discovery results with local URLs.
     """
     _mounted = mounted_robots or {}
+    # One alternation scan per robot name instead of a substring test per plugin
+    _mounted_pattern = (
+        re.compile("|".join(re.escape(name) for name in _mounted)) if _mounted else None
+    )
 
     @mcp.tool
     async def discover_robot_agents(
         robot_type: str | None = None,
         fleet_provider: str | None = None,
         chain: str | None = None,
+        limit: int | None = None,
     ) -> dict:
         """Discover robot agents registered on the ERC-8004 identity registry.
 
@@ -197,6 +760,9 @@ def register_discovery_tools(
                    "eth-mainnet", "base-sepolia", "base-mainnet". Defaults
                    to the gateway's configured chain (CHAIN env var) or
                    eth-sepolia.
+            limit: Maximum number of robots to return. Pass None to return
+                   all matches; set it (e.g. 1) when looking for a single
+                   robot to avoid scanning the whole registry.
 
         Returns:
             A dict with a "robots" list, each entry containing:
@@ -216,20 +782,23 @@ def register_discovery_tools(
                              if the robot is not in the marketplace
 
             On invalid chain: returns {"error": "...", "valid_chains": [...]}
+            On limit < 1: returns {"error": "..."}
         """
         if chain is not None and chain not in CHAIN_NAMES:
             return {
                 "error": f"Unknown chain '{chain}'.",
                 "valid_chains": CHAIN_NAMES,
             }
-        robots = discover_robots(robot_type=robot_type, fleet_provider=fleet_provider, chain=chain)
+        if limit is not None and limit < 1:
+            return {"error": "limit must be a positive integer."}
+        cached = await _discovery_cache.get(
+            robot_type=robot_type, fleet_provider=fleet_provider, chain=chain, limit=limit
+        )
+        # Copy so per-gateway enrichment never mutates the shared cache entry
+        robots = [dict(robot) for robot in cached]
 
         for robot in robots:
-            matched_endpoint = None
-            for plugin_name, endpoint in _mounted.items():
-                if plugin_name in robot.get("name", "").lower():
-                    matched_endpoint = endpoint
-                    break
-            robot["local_endpoint"] = matched_endpoint
+            match = _mounted_pattern.search((robot.get("name") or "").lower()) if _mounted_pattern else None
+            robot["local_endpoint"] = _mounted[match.group(0)] if match else None
 
         return {"robots": robots, "count": len(robots)}
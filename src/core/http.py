@@ -0,0 +1,20 @@
+"""Shared HTTP clients for robot plugins.
+
+Robot clients talking to the same base URL share one ``httpx.AsyncClient``
+(and so one keep-alive connection pool) for the life of the process.
+"""
+
+import functools
+
+import httpx
+
+
+@functools.cache
+def get_async_client(base_url: str) -> httpx.AsyncClient:
+    """Return the process-wide async client for ``base_url``."""
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=5.0,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
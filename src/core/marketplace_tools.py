@@ -1,7 +1,12 @@
-from fastmcp import FastMCP
+from typing import TYPE_CHECKING
 
 from core.plugin import RobotPlugin
 
+if TYPE_CHECKING:
+    # Robot packages import MARKETPLACE_TOOL_NAMES at discovery time; don't
+    # drag fastmcp in with it.
+    from fastmcp import FastMCP
+
 # Tool names registered by this module — used by plugins to declare them in tool_names().
 MARKETPLACE_TOOL_NAMES = [
     "robot_submit_bid",
@@ -10,7 +15,7 @@ MARKETPLACE_TOOL_NAMES = [
 ]
 
 
-def register(mcp: FastMCP, plugin: RobotPlugin) -> None:
+def register(mcp: "FastMCP", plugin: RobotPlugin) -> None:
     """Register the three marketplace tools on a robot's MCP server.
 
     Called automatically by create_robot_server() for every plugin — plugins
@@ -1,6 +1,12 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from fastmcp import FastMCP
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Annotation only — keeps `import core.plugin` (and plugin discovery) free
+    # of the fastmcp import cost.
+    from fastmcp import FastMCP
 
 
 @dataclass
@@ -41,26 +47,45 @@ class RobotPlugin(ABC):
     1. Declaring its metadata (name, type, fleet info)
     2. Registering its MCP tools on a FastMCP server instance
     3. Providing its tool names for on-chain registration
+
+    Plugins implement ``_metadata()`` and ``_tool_names()``; callers use
+    ``metadata()`` and ``tool_names()``, which memoize the results.
     """
 
     @abstractmethod
-    def metadata(self) -> RobotMetadata:
-        """Return the robot's on-chain metadata."""
+    def _metadata(self) -> RobotMetadata:
+        """Build the robot's on-chain metadata. Override in plugins."""
         ...
 
     @abstractmethod
-    def register_tools(self, mcp: FastMCP) -> None:
+    def register_tools(self, mcp: "FastMCP") -> None:
         """Register this robot's MCP tools on the shared server."""
         ...
 
     @abstractmethod
-    def tool_names(self) -> list[str]:
-        """Return the list of MCP tool names this plugin registers.
+    def _tool_names(self) -> list[str]:
+        """Build the list of MCP tool names this plugin registers. Override in plugins.
 
         Must match the function names passed to @mcp.tool exactly.
         """
         ...
 
+    @cached_property
+    def _cached_metadata(self) -> RobotMetadata:
+        return self._metadata()
+
+    @cached_property
+    def _cached_tool_names(self) -> list[str]:
+        return self._tool_names()
+
+    def metadata(self) -> RobotMetadata:
+        """Return the robot's on-chain metadata (built once per instance)."""
+        return self._cached_metadata
+
+    def tool_names(self) -> list[str]:
+        """Return the plugin's MCP tool names (built once per instance)."""
+        return self._cached_tool_names
+
     async def bid(self, task_spec: dict) -> dict | None:
         """Generate a bid for a task. Override in auction-participating plugins.
 
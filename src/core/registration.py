@@ -1,19 +1,27 @@
 """Generic ERC-8004 on-chain registration and update for robot plugins."""
 
+import functools
 import os
 
 from agent0_sdk import SDK
 from agent0_sdk.core.models import EndpointType
 from dotenv import load_dotenv
+from hexbytes import HexBytes
 
+from core import cache
 from core.chains import get_chain
+from core.discovery import fetch_agent_card
 from core.plugin import RobotPlugin
 
 load_dotenv()
 
 
+@functools.lru_cache(maxsize=None)
 def _make_sdk(*, ipfs: bool = False, chain: str | None = None) -> SDK:
-    """Create an Agent0 SDK instance.
+    """Return an Agent0 SDK instance, memoized per ``(ipfs, chain)``.
+
+    Reusing the instance keeps the web3 provider's HTTP session (and its
+    TCP/TLS connection) alive across the reads and writes of one command.
 
     Args:
         ipfs: Whether to configure IPFS/Pinata for metadata uploads.
@@ -87,6 +95,24 @@ def _build_metadata(meta) -> dict:
     return metadata
 
 
+def _card_is_current(
+    card: dict, mcp_endpoint: str, tools: list[str], fleet_endpoint: str, metadata: dict
+) -> bool:
+    """Whether an agent card already carries the MCP service and metadata we'd write.
+
+    Compares only the fields ``update_robot`` sets; anything else in the
+    card (name, description, registrations) is left as loaded.
+    """
+    mcp = next((svc for svc in card.get("services", []) if svc.get("name") == "MCP"), None)
+    return (
+        mcp is not None
+        and mcp.get("endpoint") == mcp_endpoint
+        and mcp.get("mcpTools") == tools
+        and mcp.get("fleetEndpoint") == fleet_endpoint
+        and card.get("metadata") == metadata
+    )
+
+
 def register_robot(plugin: RobotPlugin, chain: str | None = None) -> None:
     """Register a robot plugin on ERC-8004.
 
@@ -152,7 +178,8 @@ def update_robot(plugin: RobotPlugin, agent_id: str, chain: str | None = None) -
 
     Loads the agent by ID, updates its MCP endpoint, tool list, and metadata
     from the plugin, re-uploads to IPFS, and submits the update transaction.
-    RPC_URL is optional — if unset, the selected chain's default public RPC
+    If the current on-chain agent card already has those values, nothing is
+    uploaded or submitted. RPC_URL is optional — if unset, the selected chain's default public RPC
     is used.
 
     Args:
@@ -184,6 +211,19 @@ def update_robot(plugin: RobotPlugin, agent_id: str, chain: str | None = None) -
     print(f"  Updated tools: {plugin.tool_names()}")
     print(f"  robot_type={meta.robot_type}, fleet_provider={meta.fleet_provider}, fleet_domain={meta.fleet_domain}")
 
+    # Skip the Pinata upload + transaction when the on-chain card already matches
+    agent_id_int = int(str(agent_id).split(":")[-1])
+    try:
+        uri = sdk.identity_registry.functions.tokenURI(agent_id_int).call()
+        current_card = fetch_agent_card(uri)
+    except Exception:
+        current_card = None
+    if current_card is not None and _card_is_current(
+        current_card, mcp_endpoint, plugin.tool_names(), _fleet_url(), _build_metadata(meta)
+    ):
+        print(f"\nNo change — on-chain agent card ({uri}) is already up to date.")
+        return
+
     print("\nSubmitting update transaction...")
     tx_handle = agent.registerIPFS()
     print(f"Transaction submitted: {tx_handle.tx_hash}")
@@ -192,11 +232,52 @@ def update_robot(plugin: RobotPlugin, agent_id: str, chain: str | None = None) -
     mined = tx_handle.wait_mined(timeout=120)
     reg_file = mined.result
 
+    # The new tokenURI points at the re-uploaded card; drop the cached one
+    cache.invalidate_metadata(get_chain(chain)["chain_id"], agent_id_int, [cache.TOKEN_URI_KEY])
+
     print(f"\nAgent updated!")
     print(f"Agent ID:  {reg_file.agentId}")
     print(f"Agent URI: {reg_file.agentURI}")
 
 
+def _has_multicall(contract) -> bool:
+    """Whether the contract ABI exposes ``multicall(bytes[])``."""
+    return any(
+        entry.get("type") == "function" and entry.get("name") == "multicall"
+        for entry in contract.abi
+    )
+
+
+def _write_metadata(sdk: SDK, agent_id_int: int, writes: list[tuple[str, bytes]]) -> None:
+    """Set several metadata keys, in one transaction when the registry allows.
+
+    ``setMetadata`` is restricted to the agent owner, so the writes can't go
+    through an external aggregator (it would become ``msg.sender``). If the
+    registry has its own ``multicall(bytes[])`` — which delegatecalls and
+    keeps the caller — all writes are bundled into one transaction and one
+    receipt wait. Otherwise each key is written in its own transaction.
+    """
+    registry = sdk.identity_registry
+    if _has_multicall(registry):
+        calls = [
+            HexBytes(registry.encode_abi("setMetadata", args=[agent_id_int, key, value]))
+            for key, value in writes
+        ]
+        print(f"  Submitting {len(calls)} metadata update(s) in one transaction...")
+        tx = sdk.web3_client.transact_contract(registry, "multicall", calls)
+        sdk.web3_client.wait_for_transaction(tx, timeout=60)
+        print(f"    Done (tx: {tx})")
+        return
+
+    for key, value in writes:
+        print(f"  Setting '{key}'...")
+        tx = sdk.web3_client.transact_contract(
+            registry, "setMetadata", agent_id_int, key, value
+        )
+        sdk.web3_client.wait_for_transaction(tx, timeout=60)
+        print(f"    Done (tx: {tx})")
+
+
 def fix_metadata(plugin: RobotPlugin, agent_id_int: int, chain: str | None = None) -> None:
     """Fix on-chain metadata for an existing agent.
 
@@ -224,7 +305,8 @@ def fix_metadata(plugin: RobotPlugin, agent_id_int: int, chain: str | None = Non
     print(f"Fixing metadata for agent {agent_id_int} ({meta.name})...")
     print()
 
-    # Read and fix each key
+    # Read each key and collect the ones that need rewriting
+    writes: list[tuple[str, bytes]] = []
     for key, want in expected.items():
         current = sdk.identity_registry.functions.getMetadata(agent_id_int, key).call()
         current_str = current.decode() if current else "(empty)"
@@ -235,23 +317,22 @@ def fix_metadata(plugin: RobotPlugin, agent_id_int: int, chain: str | None = Non
             continue
 
         print(f"  {key}: {current_str} → {want_str}")
-        tx = sdk.web3_client.transact_contract(
-            sdk.identity_registry, "setMetadata", agent_id_int, key, want
-        )
-        sdk.web3_client.wait_for_transaction(tx, timeout=60)
-        print(f"    Done (tx: {tx})")
+        writes.append((key, want))
 
     # Clean up legacy keys
     legacy_keys = ["agent_type"]
     for key in legacy_keys:
         val = sdk.identity_registry.functions.getMetadata(agent_id_int, key).call()
         if val:
-            print(f"  Clearing legacy key '{key}' (was: {val.decode()})...")
-            tx = sdk.web3_client.transact_contract(
-                sdk.identity_registry, "setMetadata", agent_id_int, key, b""
-            )
-            sdk.web3_client.wait_for_transaction(tx, timeout=60)
-            print(f"    Done (tx: {tx})")
+            print(f"  Clearing legacy key '{key}' (was: {val.decode()})")
+            writes.append((key, b""))
+
+    if writes:
+        print()
+        _write_metadata(sdk, agent_id_int, writes)
+
+    # Discovery caches these reads; make the next lookup see the new values
+    cache.invalidate_metadata(get_chain(chain)["chain_id"], agent_id_int, [*expected, *legacy_keys])
 
     # Verify
     print("\nVerification:")
@@ -1,6 +1,8 @@
+import asyncio
+import functools
 import logging
 import os
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 
 from dotenv import load_dotenv
 from fastapi import FastAPI
@@ -13,8 +15,13 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def _make_auth():
-    """Create shared auth provider if MCP_BEARER_TOKEN is set."""
+    """Create shared auth provider if MCP_BEARER_TOKEN is set.
+
+    The verifier is stateless, so one instance is built per process and
+    shared by every robot server and the fleet server.
+    """
     bearer_token = os.getenv("MCP_BEARER_TOKEN")
     if not bearer_token:
         return None
@@ -55,14 +62,15 @@ def create_fleet_server(
     """
     auth = _make_auth()
 
+    from core.discovery import discovery_lifespan, register_discovery_tools
+
     mcp = FastMCP(
         name="Robot Fleet Orchestrator",
         instructions="Discover robots on-chain and manage the fleet.",
         auth=auth,
+        lifespan=discovery_lifespan,
     )
 
-    from core.discovery import register_discovery_tools
-
     register_discovery_tools(mcp, mounted_robots=mounted_robots)
 
     if auction_engine is not None:
@@ -76,6 +84,56 @@ def create_fleet_server(
     return mcp
 
 
+class _LazyMCPApp:
+    """ASGI app that builds a robot's MCP app on its first request.
+
+    ``factory`` returns the FastMCP ``http_app()``. Its lifespan runs in a
+    dedicated task — started on first request, stopped by ``aclose()`` —
+    so the session manager's task group is entered and exited in the same
+    task, as anyio requires.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._app = None
+        self._task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+        self._stop = asyncio.Event()
+
+    async def _run(self, app, started: asyncio.Event) -> None:
+        async with app.lifespan(app):
+            started.set()
+            await self._stop.wait()
+
+    async def _start(self):
+        async with self._lock:
+            if self._app is not None:
+                return self._app
+            app = self._factory()
+            started = asyncio.Event()
+            self._task = asyncio.create_task(self._run(app, started))
+            waiter = asyncio.create_task(started.wait())
+            await asyncio.wait({waiter, self._task}, return_when=asyncio.FIRST_COMPLETED)
+            if not started.is_set():
+                # Lifespan failed before starting — surface its exception
+                waiter.cancel()
+                task, self._task = self._task, None
+                task.result()
+            self._app = app
+            return app
+
+    async def __call__(self, scope, receive, send):
+        app = self._app or await self._start()
+        await app(scope, receive, send)
+
+    async def aclose(self) -> None:
+        """Stop the sub-app's lifespan if it was ever started."""
+        if self._task is None:
+            return
+        self._stop.set()
+        await self._task
+
+
 def create_gateway(plugins: dict[str, RobotPlugin]) -> FastAPI:
     """Create a FastAPI gateway that sub-mounts each robot's MCP server.
 
@@ -84,14 +142,15 @@ def create_gateway(plugins: dict[str, RobotPlugin]) -> FastAPI:
     All served on a single port behind one ngrok tunnel.
 
     FastMCP v3 requires each MCP app's lifespan to be started for its
-    StreamableHTTPSessionManager task group. We compose all lifespans
-    into the gateway's lifespan.
+    StreamableHTTPSessionManager task group. Robot servers are built and
+    started lazily on their first request (see ``_LazyMCPApp``); the fleet
+    server is started with the gateway. The gateway lifespan shuts them
+    all down.
     """
-    mcp_apps = {}
+    robot_apps: dict[str, _LazyMCPApp] = {}
     mounted_robots: dict[str, str] = {}
     for name, plugin in plugins.items():
-        mcp = create_robot_server(plugin)
-        mcp_apps[name] = mcp.http_app()
+        robot_apps[name] = _LazyMCPApp(lambda plug=plugin: create_robot_server(plug).http_app())
         mounted_robots[name] = f"/{name}/mcp"
 
     # Stripe payment handler (optional — requires marketplace extra + env vars)
@@ -128,33 +187,41 @@ def create_gateway(plugins: dict[str, RobotPlugin]) -> FastAPI:
     from auction.engine import AuctionEngine
     auction_engine = AuctionEngine(plugins, payment_handler=payment_handler)
     fleet_mcp = create_fleet_server(mounted_robots=mounted_robots, auction_engine=auction_engine)
-    mcp_apps["fleet"] = fleet_mcp.http_app()
+    fleet_app = fleet_mcp.http_app()
 
     @asynccontextmanager
     async def lifespan(app):
-        # Start all MCP app lifespans (initializes their task groups)
-        async with _compose_lifespans(mcp_apps.values()):
+        # Start the fleet app lifespan now; robot apps start on first use.
+        # The stack stops them in reverse order on shutdown.
+        async with AsyncExitStack() as stack:
+            await stack.enter_async_context(fleet_app.lifespan(fleet_app))
+            for robot_app in robot_apps.values():
+                stack.push_async_callback(robot_app.aclose)
             yield
 
     app = FastAPI(title="Robot Fleet Gateway", lifespan=lifespan)
 
-    for name, mcp_app in mcp_apps.items():
-        app.mount(f"/{name}", mcp_app)
+    for name, robot_app in robot_apps.items():
+        app.mount(f"/{name}", robot_app)
+    app.mount("/fleet", fleet_app)
+
+    # Static for the gateway's lifetime — build once, not per request
+    index_payload = {
+        "service": "Robot Fleet Gateway",
+        "robots": {
+            name: {
+                "mcp_endpoint": f"/{name}/mcp",
+                "tools": plugin.tool_names(),
+            }
+            for name, plugin in plugins.items()
+        },
+        "fleet_endpoint": "/fleet/mcp",
+        "stripe_webhook": "/stripe/webhook" if payment_handler else None,
+    }
 
     @app.get("/")
     async def index():
-        return {
-            "service": "Robot Fleet Gateway",
-            "robots": {
-                name: {
-                    "mcp_endpoint": f"/{name}/mcp",
-                    "tools": plugin.tool_names(),
-                }
-                for name, plugin in plugins.items()
-            },
-            "fleet_endpoint": "/fleet/mcp",
-            "stripe_webhook": "/stripe/webhook" if payment_handler else None,
-        }
+        return index_payload
 
     if payment_handler is not None:
         from auction.webhooks import make_stripe_webhook_route
@@ -166,16 +233,3 @@ def create_gateway(plugins: dict[str, RobotPlugin]) -> FastAPI:
 
     return app
 
-
-@asynccontextmanager
-async def _compose_lifespans(apps):
-    """Recursively enter the lifespan of each ASGI app."""
-    apps = list(apps)
-    if not apps:
-        yield
-        return
-
-    first, *rest = apps
-    async with first.lifespan(first):
-        async with _compose_lifespans(rest):
-            yield
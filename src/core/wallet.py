@@ -5,50 +5,85 @@ Usage via scripts/generate_wallet.py:
     uv run python scripts/generate_wallet.py --new    # Generate new wallet and save to .env
 """
 
+import functools
 import os
-import re
+from pathlib import Path
 
-from dotenv import load_dotenv
-from web3 import Web3
+from dotenv import dotenv_values
 
 
+@functools.cache
 def _env_path() -> str:
-    """Return path to .env file at repo root."""
-    return os.path.join(os.path.dirname(__file__), "..", "..", ".env")
+    """Return the absolute path to the .env file at repo root."""
+    return str(Path(__file__).resolve().parent.parent.parent / ".env")
+
+
+@functools.cache
+def _loaded_env() -> dict:
+    """Parse the repo-root .env once per process.
+
+    Call ``_loaded_env.cache_clear()`` after writing the file.
+    """
+    return dotenv_values(_env_path())
 
 
 def _update_env(key: str, value: str) -> None:
     """Update or append a key=value line in the .env file."""
-    path = os.path.abspath(_env_path())
+    _update_env_many({key: value})
+
+
+def _update_env_many(pairs: dict[str, str]) -> None:
+    """Update or append several key=value lines in one rewrite of .env.
+
+    The file is written to a sibling temp file and swapped in with
+    ``os.replace``, so a crash never leaves a half-written .env.
+    """
+    path = _env_path()
     try:
         with open(path, "r") as f:
             content = f.read()
     except FileNotFoundError:
         content = ""
 
-    if re.search(rf"^{key}=.*$", content, re.MULTILINE):
-        content = re.sub(rf"^{key}=.*$", f"{key}={value}", content, flags=re.MULTILINE)
-    else:
-        content += f"\n{key}={value}\n"
+    lines = content.splitlines(keepends=True)
+    for key, value in pairs.items():
+        prefix = f"{key}="
+        replaced = False
+        for i, line in enumerate(lines):
+            if line.startswith(prefix):
+                lines[i] = f"{key}={value}\n"
+                replaced = True
+        if not replaced:
+            lines.append(f"\n{key}={value}\n")
 
-    with open(path, "w") as f:
-        f.write(content)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        f.write("".join(lines))
+    os.replace(tmp, path)
 
 
 def get_existing_wallet():
-    """Return the Web3 account from SIGNER_PVT_KEY in .env, or None."""
-    load_dotenv(_env_path())
-    key = os.getenv("SIGNER_PVT_KEY", "").strip()
+    """Return the account for SIGNER_PVT_KEY in .env, or None."""
+    # Process environment wins over .env, as with load_dotenv()
+    key = os.environ.get("SIGNER_PVT_KEY", _loaded_env().get("SIGNER_PVT_KEY") or "").strip()
     if not key:
         return None
-    return Web3().eth.account.from_key(key)
+    # eth_account is all that's needed here; no Web3 client or provider.
+    from eth_account import Account
+
+    return Account.from_key(key)
 
 
 def generate_and_save():
     """Generate a new Ethereum wallet, save to .env, and print it."""
-    account = Web3().eth.account.create()
-    _update_env("SIGNER_PVT_KEY", account.key.hex())
-    _update_env("WALLET_ADDRESS", account.address)
+    from eth_account import Account
+
+    account = Account.create()
+    _update_env_many({
+        "SIGNER_PVT_KEY": account.key.hex(),
+        "WALLET_ADDRESS": account.address,
+    })
+    _loaded_env.cache_clear()
 
     print("=== New Ethereum Wallet ===")
     print(f"Address: {account.address}")
@@ -1,23 +1,52 @@
+import functools
 import importlib
 import pkgutil
+import sys
+from collections.abc import Callable
+from importlib.metadata import entry_points
 
 from core.plugin import RobotPlugin
 
 
-def discover_plugins() -> dict[str, type[RobotPlugin]]:
-    """Scan src/robots/ for packages that export a RobotPlugin subclass."""
-    plugins = {}
-    package = importlib.import_module("robots")
-    for _importer, modname, ispkg in pkgutil.iter_modules(package.__path__):
-        if not ispkg or modname.startswith("_"):
-            continue
-        mod = importlib.import_module(f"robots.{modname}")
-        for attr in dir(mod):
-            obj = getattr(mod, attr)
-            if (
-                isinstance(obj, type)
-                and issubclass(obj, RobotPlugin)
-                and obj is not RobotPlugin
-            ):
-                plugins[modname] = obj
-    return plugins
+@functools.cache
+def _load_plugin(modname: str) -> type[RobotPlugin]:
+    """Import ``robots.<modname>`` and return the class it exports as ``PLUGIN``."""
+    name = f"robots.{modname}"
+    # Already-imported packages skip the import machinery (and its lock).
+    mod = sys.modules.get(name) or importlib.import_module(name)
+    cls = getattr(mod, "PLUGIN", None)
+    if cls is None:
+        raise ImportError(f"robots.{modname} does not export PLUGIN = <RobotPlugin subclass>")
+    return cls
+
+
+@functools.cache
+def _local_packages() -> tuple[str, ...]:
+    """List the plugin subpackages under src/robots/ (scanned once)."""
+    return tuple(
+        modname
+        for _importer, modname, ispkg in pkgutil.iter_modules(__path__)
+        if ispkg and not modname.startswith("_")
+    )
+
+
+@functools.cache
+def discover_plugins() -> dict[str, Callable[[], type[RobotPlugin]]]:
+    """Find robot plugins without importing them.
+
+    Uses the ``yakrover.robots`` entry points declared in ``pyproject.toml``
+    when the project is installed — a metadata lookup, no filesystem walk.
+    Falls back to scanning src/robots/ when no entry points are registered
+    (e.g. running from a plain checkout).
+
+    Returns a map of plugin name → zero-argument loader. Calling the loader
+    imports that one package and returns its RobotPlugin subclass, so
+    callers only pay the import cost for the robots they actually use.
+
+    The result is cached for the life of the process; treat it as read-only.
+    """
+    eps = entry_points(group="yakrover.robots")
+    if eps:
+        return {ep.name: ep.load for ep in eps}
+
+    return {modname: functools.partial(_load_plugin, modname) for modname in _local_packages()}
@@ -2,7 +2,8 @@
 Template robot plugin — copy this directory to create a new robot.
 
 1. Copy _template/ to a new directory: cp -r _template/ myrobot/
-2. Rename the class and fill in metadata()
+2. Rename the class (and the PLUGIN export at the bottom) and fill in
+   _metadata() and _tool_names()
 3. Implement client.py for your robot's communication protocol
 4. Define MCP tools in tools.py
 5. Add optional dependencies to pyproject.toml if needed
@@ -12,7 +13,7 @@ from core.plugin import RobotPlugin, RobotMetadata
 
 
 class TemplatePlugin(RobotPlugin):
-    def metadata(self) -> RobotMetadata:
+    def _metadata(self) -> RobotMetadata:
         return RobotMetadata(
             name="My Robot",
             description="Description of your robot.",
@@ -22,7 +23,7 @@ class TemplatePlugin(RobotPlugin):
             fleet_domain="yakrover.com/dev",
         )
 
-    def tool_names(self) -> list[str]:
+    def _tool_names(self) -> list[str]:
         return ["myrobot_is_online"]
 
     def register_tools(self, mcp):
@@ -30,3 +31,6 @@ class TemplatePlugin(RobotPlugin):
         from .tools import register
 
         register(mcp, TemplateClient())
+
+
+PLUGIN = TemplatePlugin
@@ -1,5 +1,6 @@
 import os
-import httpx
+
+from core.http import get_async_client
 
 
 class TemplateClient:
@@ -10,12 +11,11 @@ class TemplateClient:
 
     def __init__(self):
         self.base_url = os.getenv("MYROBOT_URL", "http://localhost:8080")
-        self.client = httpx.AsyncClient(base_url=self.base_url, timeout=5.0)
+        self.client = get_async_client(self.base_url)
 
     async def get(self, path: str) -> dict:
         resp = await self.client.get(path)
         resp.raise_for_status()
-        try:
+        if resp.headers.get("content-type", "").startswith("application/json"):
             return resp.json()
-        except Exception:
-            return {"status": "ok", "body": resp.text}
+        return {"status": "ok", "body": resp.text}
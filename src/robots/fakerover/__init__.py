@@ -5,7 +5,7 @@ from core.plugin import BiddingTerms, RobotPlugin, RobotMetadata
 
 
 class FakeRoverPlugin(RobotPlugin):
-    def metadata(self) -> RobotMetadata:
+    def _metadata(self) -> RobotMetadata:
         return RobotMetadata(
             name="FakeRover-Finland-01",
             description="A simulated differential-drive rover for development and testing.",
@@ -24,7 +24,7 @@ class FakeRoverPlugin(RobotPlugin):
             ),
         )
 
-    def tool_names(self) -> list[str]:
+    def _tool_names(self) -> list[str]:
         return [
             "fakerover_move",
             "fakerover_is_online",
@@ -105,3 +105,6 @@ class FakeRoverPlugin(RobotPlugin):
                 "duration_seconds": duration,
             },
         }
+
+
+PLUGIN = FakeRoverPlugin
@@ -5,23 +5,29 @@ Run standalone:  uv run python -m robots.fakerover.simulator
 Starts on port 8080 by default.
 """
 
-import asyncio
 import random
 import time
+from dataclasses import dataclass
 
 from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
-import uvicorn
+from fastapi.responses import HTMLResponse, ORJSONResponse
 
-app = FastAPI(title="Fake Rover Simulator")
+# The JSON endpoints return plain dicts; serialize them with orjson.
+app = FastAPI(title="Fake Rover Simulator", default_response_class=ORJSONResponse)
+
+
+@dataclass(slots=True)
+class _State:
+    """Simulated rover state."""
+
+    direction: str = "stop"
+    moving_since: float | None = None
+    stop_at: float = 0.0  # time.monotonic() deadline for the current movement
+    temperature: float = 22.5
+    humidity: float = 45.0
 
-# Simulated state
-_state = {
-    "direction": "stop",
-    "moving_since": None,
-    "temperature": 22.5,
-    "humidity": 45.0,
-}
+
+_state = _State()
 
 # Auto-stop durations (seconds), matching real Tumbller behavior
 _AUTO_STOP = {
@@ -31,13 +37,39 @@ _AUTO_STOP = {
     "right": 1.0,
 }
 
+# Private generator so sensor drift doesn't go through the shared
+# module-level random instance.
+_rng = random.Random()
+_uniform = _rng.uniform
+
+# Responses never vary per request, so build them once. Starlette responses
+# hold their encoded body and headers and can be sent any number of times.
+_MOTOR_RESPONSES = {
+    d: HTMLResponse(f"<h1>Motor: {d}</h1>") for d in (*_AUTO_STOP, "stop")
+}
+
+_INFO_STATIC = {
+    "name": "Fake Rover",
+    "firmware": "simulator-1.0.0",
+}
+
+
+def _current_direction() -> str:
+    """Return the current direction, applying any auto-stop that is due."""
+    state = _state
+    if state.direction != "stop" and time.monotonic() >= state.stop_at:
+        state.direction = "stop"
+        state.moving_since = None
+    return state.direction
+
 
 def _drift_sensor():
     """Add small random drift to sensor readings for realism."""
-    _state["temperature"] += random.uniform(-0.3, 0.3)
-    _state["humidity"] += random.uniform(-0.5, 0.5)
-    _state["temperature"] = round(max(15.0, min(35.0, _state["temperature"])), 1)
-    _state["humidity"] = round(max(20.0, min(80.0, _state["humidity"])), 1)
+    state = _state
+    t = state.temperature + _uniform(-0.3, 0.3)
+    h = state.humidity + _uniform(-0.5, 0.5)
+    state.temperature = 15.0 if t < 15.0 else 35.0 if t > 35.0 else t
+    state.humidity = 20.0 if h < 20.0 else 80.0 if h > 80.0 else h
 
 
 @app.get("/motor/{direction}")
@@ -48,38 +80,30 @@ async def motor(direction: str):
     Returns plain-text HTML like the real ESP32 firmware.
     """
     if direction == "stop":
-        _state["direction"] = "stop"
-        _state["moving_since"] = None
-        return HTMLResponse(f"<h1>Motor: stop</h1>")
+        _state.direction = "stop"
+        _state.moving_since = None
+        return _MOTOR_RESPONSES["stop"]
 
-    if direction not in _AUTO_STOP:
+    duration = _AUTO_STOP.get(direction)
+    if duration is None:
         return {"error": f"Unknown direction: {direction}"}
 
-    _state["direction"] = direction
-    _state["moving_since"] = time.time()
+    # Auto-stop is evaluated lazily by _current_direction() against this
+    # deadline rather than by a sleeping task per request.
+    _state.direction = direction
+    _state.moving_since = time.time()
+    _state.stop_at = time.monotonic() + duration
 
-    # Simulate auto-stop delay (non-blocking)
-    duration = _AUTO_STOP[direction]
-
-    async def auto_stop():
-        await asyncio.sleep(duration)
-        if _state["direction"] == direction:
-            _state["direction"] = "stop"
-            _state["moving_since"] = None
-
-    asyncio.create_task(auto_stop())
-
-    return HTMLResponse(f"<h1>Motor: {direction}</h1>")
+    return _MOTOR_RESPONSES[direction]
 
 
 @app.get("/info")
 async def info():
     """Robot info endpoint. Returns JSON like the real Tumbller."""
     return {
-        "name": "Fake Rover",
-        "firmware": "simulator-1.0.0",
+        **_INFO_STATIC,
         "uptime_seconds": int(time.time()) % 86400,
-        "direction": _state["direction"],
+        "direction": _current_direction(),
     }
 
 
@@ -87,11 +111,14 @@ async def info():
 async def sensor_ht():
     """Temperature and humidity sensor. Returns JSON with drifting values."""
     _drift_sensor()
+    # State keeps full precision; round only what the endpoint reports.
     return {
-        "temperature": _state["temperature"],
-        "humidity": _state["humidity"],
+        "temperature": round(_state.temperature, 1),
+        "humidity": round(_state.humidity, 1),
     }
 
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run(app, host="0.0.0.0", port=8080)
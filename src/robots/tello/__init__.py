@@ -5,7 +5,7 @@ from core.plugin import BiddingTerms, RobotPlugin, RobotMetadata
 
 
 class TelloPlugin(RobotPlugin):
-    def metadata(self) -> RobotMetadata:
+    def _metadata(self) -> RobotMetadata:
         return RobotMetadata(
             name="DJI Tello Drone",
             description="A DJI Tello quadrotor drone controllable via MCP.",
@@ -24,7 +24,7 @@ class TelloPlugin(RobotPlugin):
             ),
         )
 
-    def tool_names(self) -> list[str]:
+    def _tool_names(self) -> list[str]:
         return [
             "tello_takeoff",
             "tello_land",
@@ -135,3 +135,6 @@ class TelloPlugin(RobotPlugin):
                 "telemetry": partial_data,
             },
         }
+
+
+PLUGIN = TelloPlugin
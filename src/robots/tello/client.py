@@ -1,5 +1,6 @@
 import os
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 from djitellopy import Tello
 
@@ -8,77 +9,94 @@ class TelloClient:
     """Wrapper around djitellopy.Tello for use in async FastMCP tools.
 
     The djitellopy library is synchronous (UDP sockets + blocking waits).
-    This wrapper runs all Tello commands in a thread pool executor so they
-    don't block the FastMCP async event loop.
+    This wrapper runs all Tello commands on a dedicated single-thread
+    executor so they don't block the FastMCP async event loop. One worker
+    matches the drone's one command socket, so commands also never overlap.
     """
 
     def __init__(self):
         host = os.getenv("TELLO_HOST", Tello.TELLO_IP)
         self.tello = Tello(host=host)
         self._connected = False
+        # sdk_version / serial_number never change for a given drone.
+        self._static_info: dict | None = None
+        self._executor: ThreadPoolExecutor | None = None
 
     async def connect(self) -> dict:
         """Enter SDK mode and establish communication."""
-        await asyncio.to_thread(self.tello.connect)
+        await self._call(self.tello.connect)
         self._connected = True
         return {"status": "connected"}
 
     async def takeoff(self) -> dict:
         """Take off and hover."""
         await self._ensure_connected()
-        await asyncio.to_thread(self.tello.takeoff)
+        await self._call(self.tello.takeoff)
         return {"status": "ok", "action": "takeoff"}
 
     async def land(self) -> dict:
         """Land the drone."""
         await self._ensure_connected()
-        await asyncio.to_thread(self.tello.land)
+        await self._call(self.tello.land)
         return {"status": "ok", "action": "land"}
 
     async def move(self, direction: str, distance: int) -> dict:
         """Move in a direction by distance cm (20-500)."""
         await self._ensure_connected()
         move_fn = getattr(self.tello, f"move_{direction}")
-        await asyncio.to_thread(move_fn, distance)
+        await self._call(move_fn, distance)
         return {"status": "ok", "direction": direction, "distance_cm": distance}
 
     async def rotate(self, direction: str, degrees: int) -> dict:
         """Rotate clockwise or counter_clockwise by degrees (1-360)."""
         await self._ensure_connected()
         if direction == "clockwise":
-            await asyncio.to_thread(self.tello.rotate_clockwise, degrees)
+            await self._call(self.tello.rotate_clockwise, degrees)
         else:
-            await asyncio.to_thread(self.tello.rotate_counter_clockwise, degrees)
+            await self._call(self.tello.rotate_counter_clockwise, degrees)
         return {"status": "ok", "direction": direction, "degrees": degrees}
 
     async def flip(self, direction: str) -> dict:
         """Flip in a direction: forward, back, left, right."""
         await self._ensure_connected()
         flip_fn = getattr(self.tello, f"flip_{direction}")
-        await asyncio.to_thread(flip_fn)
+        await self._call(flip_fn)
         return {"status": "ok", "action": "flip", "direction": direction}
 
     async def get_status(self) -> dict:
         """Get operational status."""
         await self._ensure_connected()
-        return await asyncio.to_thread(self._read_status)
+        return self._read_status()
 
     async def get_attitude(self) -> dict:
         """Get IMU attitude and spatial data."""
         await self._ensure_connected()
-        return await asyncio.to_thread(self._read_attitude)
+        return self._read_attitude()
 
     async def get_drone_info(self) -> dict:
-        """Get static drone info."""
+        """Get static drone info.
+
+        The query_* commands share djitellopy's single response queue, so
+        they must not overlap; instead the static fields are queried once
+        and only the Wi-Fi SNR is re-read on later calls.
+        """
         await self._ensure_connected()
-        return await asyncio.to_thread(self._read_info)
+        if self._static_info is None:
+            sdk_version = await self._call(self.tello.query_sdk_version)
+            serial_number = await self._call(self.tello.query_serial_number)
+            self._static_info = {
+                "sdk_version": sdk_version,
+                "serial_number": serial_number,
+            }
+        wifi_snr = await self._call(self.tello.query_wifi_signal_noise_ratio)
+        return {**self._static_info, "wifi_snr": wifi_snr}
 
     async def is_online(self) -> dict:
         """Check if the drone is reachable."""
         try:
             if not self._connected:
                 await self.connect()
-            battery = await asyncio.to_thread(self.tello.get_battery)
+            battery = await self._call(self.tello.get_battery)
             return {"online": True, "battery": battery}
         except Exception:
             return {"online": False}
@@ -86,10 +104,21 @@ class TelloClient:
     async def disconnect(self):
         """Clean up the Tello connection."""
         try:
-            await asyncio.to_thread(self.tello.end)
+            await self._call(self.tello.end)
         except Exception:
             pass
         self._connected = False
+        self._static_info = None
+        # A later connect() starts a fresh executor.
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _call(self, fn, *args):
+        """Run a blocking djitellopy call on this drone's command thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tello")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
 
     async def _ensure_connected(self):
         """Auto-connect if not already connected."""
@@ -97,32 +126,30 @@ class TelloClient:
             await self.connect()
 
     def _read_status(self) -> dict:
-        """Synchronous helper to read status fields."""
+        """Read status fields from one snapshot of the drone's state packet.
+
+        djitellopy's state listener thread keeps the latest packet parsed in
+        memory, so this never blocks on the network.
+        """
+        state = self.tello.get_current_state()
         return {
-            "battery": self.tello.get_battery(),
-            "height_cm": self.tello.get_height(),
-            "flight_time_s": self.tello.get_flight_time(),
-            "temperature_c": self.tello.get_temperature(),
+            "battery": state["bat"],
+            "height_cm": state["h"],
+            "flight_time_s": state["time"],
+            "temperature_c": (state["templ"] + state["temph"]) / 2,
             "is_flying": self.tello.is_flying,
         }
 
     def _read_attitude(self) -> dict:
-        """Synchronous helper to read attitude fields."""
-        return {
-            "pitch": self.tello.get_pitch(),
-            "roll": self.tello.get_roll(),
-            "yaw": self.tello.get_yaw(),
-            "barometer_cm": self.tello.get_barometer(),
-            "tof_distance_cm": self.tello.get_distance_tof(),
-            "speed_x": self.tello.get_speed_x(),
-            "speed_y": self.tello.get_speed_y(),
-            "speed_z": self.tello.get_speed_z(),
-        }
-
-    def _read_info(self) -> dict:
-        """Synchronous helper to read static info."""
+        """Read attitude fields from one snapshot of the drone's state packet."""
+        state = self.tello.get_current_state()
         return {
-            "sdk_version": self.tello.query_sdk_version(),
-            "serial_number": self.tello.query_serial_number(),
-            "wifi_snr": self.tello.query_wifi_signal_noise_ratio(),
+            "pitch": state["pitch"],
+            "roll": state["roll"],
+            "yaw": state["yaw"],
+            "barometer_cm": state["baro"] * 100,
+            "tof_distance_cm": state["tof"],
+            "speed_x": state["vgx"],
+            "speed_y": state["vgy"],
+            "speed_z": state["vgz"],
         }
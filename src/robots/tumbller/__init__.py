@@ -5,7 +5,7 @@ from core.plugin import BiddingTerms, RobotPlugin, RobotMetadata
 
 
 class TumbllerPlugin(RobotPlugin):
-    def metadata(self) -> RobotMetadata:
+    def _metadata(self) -> RobotMetadata:
         return RobotMetadata(
             name="Tumbller Self-Balancing Robot",
             description="A physical ESP32-S3 two-wheeled robot controllable via MCP.",
@@ -24,7 +24,7 @@ class TumbllerPlugin(RobotPlugin):
             ),
         )
 
-    def tool_names(self) -> list[str]:
+    def _tool_names(self) -> list[str]:
         return [
             "tumbller_move",
             "tumbller_is_online",
@@ -106,3 +106,6 @@ class TumbllerPlugin(RobotPlugin):
                 "duration_seconds": duration,
             },
         }
+
+
+PLUGIN = TumbllerPlugin